@@ -21,6 +21,7 @@ class TestBinaryParser(TestCase):
 
         next_n_bytes = binary_parser.read(2)
         self.assertEqual(test_bytes[3:5], next_n_bytes)
+        self.assertIsInstance(next_n_bytes, bytes)
 
     def test_int_read_methods(self):
         test_hex = "01000200000003"
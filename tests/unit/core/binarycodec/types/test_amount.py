@@ -71,6 +71,24 @@ IOU_CASES = [
         "D843F28CB71571C700000000000000000000000055534400"
         "000000000000000000000000000000000000000000000001",
     ],
+    [
+        {
+            "value": "-1234567890123456",
+            "currency": "USD",
+            "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+        },
+        "984462D53C8ABAC00000000000000000000000005553440000"
+        "0000008B1CE810C13D6F337DAC85863B3D70265A24DF44",
+    ],
+    [
+        {
+            "value": "1.234567890123456E+95",
+            "currency": "USD",
+            "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+        },
+        "EC4462D53C8ABAC00000000000000000000000005553440000"
+        "0000008B1CE810C13D6F337DAC85863B3D70265A24DF44",
+    ],
 ]
 
 # [XRP value, hex encoding]
@@ -84,14 +102,20 @@ class TestAmount(TestSerializedType):
     def test_assert_xrp_is_valid_passes(self):
         valid_zero = "0"
         valid_amount = "1000"
+        valid_amount_max = "100000000000000000"
+        valid_zero_long = "0" * 5000
 
         amount.verify_xrp_value(valid_zero)
         amount.verify_xrp_value(valid_amount)
+        amount.verify_xrp_value(valid_amount_max)
+        amount.verify_xrp_value(valid_zero_long)
 
     def test_assert_xrp_is_valid_raises(self):
         invalid_amount_large = "1e20"
         invalid_amount_small = "1e-7"
         invalid_amount_decimal = "1.234"
+        invalid_amount_over_max = "100000000000000001"
+        invalid_amount_long = "1" * 5000
 
         self.assertRaises(
             XRPLBinaryCodecException,
@@ -108,6 +132,16 @@ class TestAmount(TestSerializedType):
             amount.verify_xrp_value,
             invalid_amount_decimal,
         )
+        self.assertRaises(
+            XRPLBinaryCodecException,
+            amount.verify_xrp_value,
+            invalid_amount_over_max,
+        )
+        self.assertRaises(
+            XRPLBinaryCodecException,
+            amount.verify_xrp_value,
+            invalid_amount_long,
+        )
 
     def test_assert_iou_is_valid(self):
         # { zero, pos, negative } * fractional, large, small
@@ -120,21 +154,80 @@ class TestAmount(TestSerializedType):
             "-1.1",
             "1111111111111111.0",
             "0.00000000001",
+            "-1234567890123456",
+            "1234567890123456e80",
+            "1.234567890123456E+95",
+            "733629687074914e-3",
         ]
         for case in cases:
             amount.verify_iou_value(case)
 
+    def test_assert_iou_is_valid_raises(self):
+        cases = [
+            "12345678901234567",
+            "1e81",
+            "1e-97",
+        ]
+        for case in cases:
+            self.assertRaises(
+                XRPLBinaryCodecException, amount.verify_iou_value, case
+            )
+
+    def test_raises_invalid_issued_currency_value_type(self):
+        self.assertRaises(XRPLBinaryCodecException, amount.verify_iou_value, 1)
+        invalid_value = {
+            "value": 1,
+            "currency": "USD",
+            "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+        }
+        self.assertRaises(
+            XRPLBinaryCodecException, amount.Amount.from_value, invalid_value
+        )
+
     def test_raises_invalid_value_type(self):
         invalid_value = [1, 2, 3]
         self.assertRaises(
             XRPLBinaryCodecException, amount.Amount.from_value, invalid_value
         )
 
+    def test_raises_invalid_currency_and_issuer_type(self):
+        invalid_values = [
+            {
+                "value": "1",
+                "currency": ["USD"],
+                "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+            },
+            {
+                "value": "1",
+                "currency": "USD",
+                "issuer": {"address": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw"},
+            },
+            {
+                "value": "1",
+                "currency": 1,
+                "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+            },
+        ]
+        for invalid_value in invalid_values:
+            self.assertRaises(
+                XRPLBinaryCodecException, amount.Amount.from_value, invalid_value
+            )
+
     def test_from_value_issued_currency(self):
         for json, serialized in IOU_CASES:
             amount_object = amount.Amount.from_value(json)
             self.assertEqual(amount_object.to_hex(), serialized)
 
+    def test_from_value_issued_currency_rounds_to_zero(self):
+        # too small to be represented with a 16-digit mantissa
+        json = {
+            "value": "1e-96",
+            "currency": "USD",
+            "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+        }
+        amount_object = amount.Amount.from_value(json)
+        self.assertEqual(amount_object.to_hex(), IOU_CASES[0][1])
+
     def test_from_value_xrp(self):
         for json, serialized in XRP_CASES:
             amount_object = amount.Amount.from_value(json)
@@ -152,6 +245,41 @@ class TestAmount(TestSerializedType):
             amount_object = amount.Amount.from_parser(parser)
             self.assertEqual(amount_object.to_json(), json)
 
+    def test_to_json_issued_currency_round_trip(self):
+        # [value, value returned by to_json]
+        cases = [
+            ["-1234567890123456", "-1234567890123456"],
+            ["-102827.8236028957", "-102827.8236028957"],
+            ["12000", "12000"],
+            ["1e20", "1E+20"],
+            ["1.234567890123456e95", "1.234567890123456E+95"],
+            ["10e80", "1.0E+81"],
+            ["33e80", "3.3E+81"],
+            ["1e-81", "1E-81"],
+        ]
+        for value, expected in cases:
+            json = {
+                "value": value,
+                "currency": "USD",
+                "issuer": "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw",
+            }
+            serialized = amount.Amount.from_value(json).to_hex()
+            parser = BinaryParser(serialized)
+            round_tripped = amount.Amount.from_parser(parser).to_json()
+            self.assertEqual(round_tripped, {**json, "value": expected})
+            self.assertEqual(
+                amount.Amount.from_value(round_tripped).to_hex(), serialized
+            )
+
+    def test_to_json_issued_currency_invalid_exponent(self):
+        # exponent 81 is out of range for an issued currency amount
+        serialized = (
+            "EC838D7EA4C680000000000000000000000000005553440000"
+            "0000008B1CE810C13D6F337DAC85863B3D70265A24DF44"
+        )
+        amount_object = amount.Amount.from_parser(BinaryParser(serialized))
+        self.assertRaises(XRPLBinaryCodecException, amount_object.to_json)
+
     def test_fixtures(self):
         for fixture in data_driven_fixtures_for_type("Amount"):
             self.fixture_test(fixture)
@@ -32,7 +32,8 @@ class BinaryParser:
 
     def __init__(self: BinaryParser, hex_bytes: str) -> None:
         """Construct a BinaryParser that will parse hex-encoded bytes."""
-        self.bytes = bytes.fromhex(hex_bytes)
+        # A memoryview lets skip() drop consumed bytes without copying the rest
+        self.bytes = memoryview(bytes.fromhex(hex_bytes))
 
     def __len__(self: BinaryParser) -> int:
         """Return the number of bytes in this parser's buffer."""
@@ -75,7 +76,7 @@ class BinaryParser:
         Returns:
             The bytes read.
         """
-        first_n_bytes = self.bytes[:n]
+        first_n_bytes = bytes(self.bytes[:n])
         self.skip(n)
         return first_n_bytes
 
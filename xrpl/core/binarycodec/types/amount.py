@@ -4,8 +4,10 @@ See `Amount Fields <https://xrpl.org/serialization.html#amount-fields>`_
 """
 from __future__ import annotations
 
-from decimal import Context, Decimal, setcontext
-from typing import Any, Dict, Optional, Type, Union
+import struct
+from decimal import Context, Decimal, DecimalTuple, setcontext
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 from typing_extensions import Final
 
@@ -14,7 +16,6 @@ from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.account_id import AccountID
 from xrpl.core.binarycodec.types.currency import Currency
 from xrpl.core.binarycodec.types.serialized_type import SerializedType
-from xrpl.models.amounts import IssuedCurrencyAmount
 
 # Constants for validating amounts.
 _MIN_IOU_EXPONENT: Final[int] = -96
@@ -30,25 +31,22 @@ setcontext(
 
 _MAX_DROPS: Final[Decimal] = Decimal("1e17")
 _MIN_XRP: Final[Decimal] = Decimal("1e-6")
+_MAX_DROPS_INT: Final[int] = 10 ** 17
+_MAX_DROPS_DIGITS: Final[int] = 18  # len(str(_MAX_DROPS_INT))
 
 # other constants:
 _NOT_XRP_BIT_MASK: Final[int] = 0x80
 _POS_SIGN_BIT_MASK: Final[int] = 0x4000000000000000
+_MANTISSA_BIT_MASK: Final[int] = 0x003FFFFFFFFFFFFF
+# "Is positive" bit to set, indexed by the sign of a Decimal tuple
+_SIGN_BIT_MASKS: Final[Tuple[int, int]] = (_POS_SIGN_BIT_MASK, 0)
 _ZERO_CURRENCY_AMOUNT_HEX: Final[int] = 0x8000000000000000
 _NATIVE_AMOUNT_BYTE_LENGTH: Final[int] = 8
 _CURRENCY_AMOUNT_BYTE_LENGTH: Final[int] = 48
 
-
-def _contains_decimal(string: str) -> bool:
-    """Returns True if the given string contains a decimal point character.
-
-    Args:
-        string: The string to check.
-
-    Returns:
-        True if the string contains a decimal point character.
-    """
-    return string.find(".") == -1
+# Pre-compiled packer for the 64-bit big-endian amount value
+_U64: Final[struct.Struct] = struct.Struct(">Q")
+_ZERO_IOU_BYTES: Final[bytes] = _U64.pack(_ZERO_CURRENCY_AMOUNT_HEX)
 
 
 def verify_xrp_value(xrp_value: str) -> None:
@@ -65,8 +63,15 @@ def verify_xrp_value(xrp_value: str) -> None:
     Raises:
         XRPLBinaryCodecException: If xrp_value is not a valid XRP amount.
     """
+    # Plain drop amounts (the common case) don't need a Decimal to be validated.
+    # Longer strings take the Decimal path, since int() refuses very long ones.
+    if len(xrp_value) <= _MAX_DROPS_DIGITS and xrp_value.isdecimal():
+        if int(xrp_value) > _MAX_DROPS_INT:
+            raise XRPLBinaryCodecException(f"{xrp_value} is an invalid XRP amount.")
+        return
+
     # Contains no decimal point
-    if not _contains_decimal(xrp_value):
+    if "." in xrp_value:
         raise XRPLBinaryCodecException(f"{xrp_value} is an invalid XRP amount.")
 
     # Within valid range
@@ -78,6 +83,21 @@ def verify_xrp_value(xrp_value: str) -> None:
         raise XRPLBinaryCodecException(f"{xrp_value} is an invalid XRP amount.")
 
 
+def _parse_xrp_drops(xrp_value: str) -> int:
+    """
+    Validates an XRP amount (see verify_xrp_value) and converts it to an integer
+    number of drops.
+
+    Args:
+        xrp_value: A string representing an amount of XRP.
+
+    Returns:
+        The number of drops represented by xrp_value.
+    """
+    verify_xrp_value(xrp_value)
+    return int(xrp_value)
+
+
 def verify_iou_value(issued_currency_value: str) -> None:
     """
     Validates the format of an issued currency amount value.
@@ -93,44 +113,50 @@ def verify_iou_value(issued_currency_value: str) -> None:
     Raises:
         XRPLBinaryCodecException: If issued_currency_value is invalid.
     """
+    if not isinstance(issued_currency_value, str):
+        raise XRPLBinaryCodecException(
+            "Invalid type for an issued currency value: expected str,"
+            f" received {issued_currency_value.__class__.__name__}."
+        )
     decimal_value = Decimal(issued_currency_value)
     if decimal_value.is_zero():
         return
-    exponent = decimal_value.as_tuple().exponent
-    if (
-        (_calculate_precision(issued_currency_value) > _MAX_IOU_PRECISION)
-        or (exponent > _MAX_IOU_EXPONENT)
-        or (exponent < _MIN_IOU_EXPONENT)
-    ):
-        raise XRPLBinaryCodecException(
-            "Decimal precision out of range for issued currency value."
-        )
-    _verify_no_decimal(decimal_value)
+    _verify_iou_decimal(decimal_value)
 
 
-def _calculate_precision(value: str) -> int:
-    """Calculate the precision of given value as a string."""
-    no_decimal_point = value.replace(".", "")
-    no_leading_or_trailing_zeros = no_decimal_point.strip("0")
-    return len(no_leading_or_trailing_zeros)
+def _verify_iou_decimal(decimal_value: Decimal) -> DecimalTuple:
+    """
+    Validates a nonzero issued currency value that has already been parsed.
 
+    Args:
+        decimal_value: The issued currency value, as a nonzero Decimal.
 
-def _verify_no_decimal(decimal: Decimal) -> None:
-    """
-    Ensure that the value after being multiplied by the exponent
-    does not contain a decimal.
+    Returns:
+        The (sign, digits, exponent) tuple of decimal_value, so that callers
+        don't need to decompose the Decimal again.
 
-    :param decimal: A Decimal object.
+    Raises:
+        XRPLBinaryCodecException: If decimal_value is invalid.
     """
-    actual_exponent = decimal.as_tuple().exponent
-    exponent = Decimal("1e" + str(-(int(actual_exponent) - 15)))
-    if actual_exponent == 0:
-        int_number_string = "".join([str(d) for d in decimal.as_tuple().digits])
-    else:
-        # str(Decimal) uses sci notation by default... get around w/ string format
-        int_number_string = "{:f}".format(decimal * exponent)
-    if not _contains_decimal(int_number_string):
-        raise XRPLBinaryCodecException("Decimal place found in int_number_str")
+    value_tuple = decimal_value.as_tuple()
+    exponent = value_tuple.exponent
+    if _calculate_precision(value_tuple.digits) > _MAX_IOU_PRECISION or not (
+        _MIN_IOU_EXPONENT <= exponent <= _MAX_IOU_EXPONENT
+    ):
+        raise XRPLBinaryCodecException(
+            "Decimal precision out of range for issued currency value."
+        )
+    # With at most 16 significant digits, the value always scales to an
+    # integer mantissa, so no separate check for a fractional part is needed.
+    return value_tuple
+
+
+def _calculate_precision(digits: Tuple[int, ...]) -> int:
+    """Calculate the number of significant digits, ignoring trailing zeros."""
+    precision = len(digits)
+    while precision > 1 and digits[precision - 1] == 0:
+        precision -= 1
+    return precision
 
 
 def _serialize_issued_currency_value(value: str) -> bytes:
@@ -140,31 +166,42 @@ def _serialize_issued_currency_value(value: str) -> bytes:
     :param value: The value to serialize, as a string.
     :return: A bytes object encoding the serialized value.
     """
-    verify_iou_value(value)
+    if not isinstance(value, str):
+        raise XRPLBinaryCodecException(
+            "Invalid type for an issued currency value: expected str,"
+            f" received {value.__class__.__name__}."
+        )
     decimal_value = Decimal(value)
     if decimal_value.is_zero():
-        return _ZERO_CURRENCY_AMOUNT_HEX.to_bytes(8, byteorder="big")
+        return _ZERO_IOU_BYTES
+    sign, digits, exp = _verify_iou_decimal(decimal_value)
 
     # Convert components to integers ---------------------------------------
-    sign, digits, exp = decimal_value.as_tuple()
-    mantissa = int("".join([str(d) for d in digits]))
+    mantissa = 0
+    for digit in digits:
+        mantissa = mantissa * 10 + digit
 
     # Canonicalize to expected range ---------------------------------------
-    while mantissa < _MIN_MANTISSA and exp > _MIN_IOU_EXPONENT:
-        mantissa *= 10
-        exp -= 1
-
-    while mantissa > _MAX_MANTISSA:
-        if exp >= _MAX_IOU_EXPONENT:
+    # A nonzero Decimal has no leading zeros, so the number of digits tells us
+    # how far the mantissa is from the 16-digit range in a single step.
+    shift = _MAX_IOU_PRECISION - len(digits)
+    if shift > 0:
+        # Scale up, but never below the minimum exponent
+        shift = min(shift, exp - _MIN_IOU_EXPONENT)
+        mantissa *= 10 ** shift
+        exp -= shift
+    elif shift < 0:
+        # Scale down (only trailing zeros, since the precision was verified)
+        if exp - shift > _MAX_IOU_EXPONENT:
             raise XRPLBinaryCodecException(
                 f"Amount overflow in issued currency value {str(value)}"
             )
-        mantissa //= 10
-        exp += 1
+        mantissa //= 10 ** -shift
+        exp -= shift
 
     if exp < _MIN_IOU_EXPONENT or mantissa < _MIN_MANTISSA:
         # Round to zero
-        _ZERO_CURRENCY_AMOUNT_HEX.to_bytes(8, byteorder="big", signed=False)
+        return _ZERO_IOU_BYTES
 
     if exp > _MAX_IOU_EXPONENT or mantissa > _MAX_MANTISSA:
         raise XRPLBinaryCodecException(
@@ -172,13 +209,12 @@ def _serialize_issued_currency_value(value: str) -> bytes:
         )
 
     # Convert to bytes -----------------------------------------------------
-    serial = _ZERO_CURRENCY_AMOUNT_HEX  # "Not XRP" bit set
-    if sign == 0:
-        serial |= _POS_SIGN_BIT_MASK  # "Is positive" bit set
-    serial |= (exp + 97) << 54  # next 8 bits are exponents
-    serial |= mantissa  # last 54 bits are mantissa
-
-    return serial.to_bytes(8, byteorder="big", signed=False)
+    return _U64.pack(
+        _ZERO_CURRENCY_AMOUNT_HEX  # "Not XRP" bit set
+        | _SIGN_BIT_MASKS[sign]  # "Is positive" bit set if sign is 0
+        | ((exp + 97) << 54)  # next 8 bits are exponents
+        | mantissa  # last 54 bits are mantissa
+    )
 
 
 def _serialize_xrp_amount(value: str) -> bytes:
@@ -190,10 +226,66 @@ def _serialize_xrp_amount(value: str) -> bytes:
     Returns:
         The bytes representing the serialized XRP amount.
     """
-    verify_xrp_value(value)
     # set the "is positive" bit (this is backwards from usual two's complement!)
-    value_with_pos_bit = int(value) | _POS_SIGN_BIT_MASK
-    return value_with_pos_bit.to_bytes(8, byteorder="big")
+    value_with_pos_bit = _parse_xrp_drops(value) | _POS_SIGN_BIT_MASK
+    return _U64.pack(value_with_pos_bit)
+
+
+def _is_valid_issued_currency_amount(value: Dict[str, Any]) -> bool:
+    """
+    Determines whether a dictionary represents an issued currency amount,
+    with exactly the "currency", "issuer" and "value" keys.
+
+    Args:
+        value: The dictionary to check.
+
+    Returns:
+        True if value is an issued currency amount dictionary, False otherwise.
+    """
+    return (
+        len(value) == 3
+        and "currency" in value
+        and "issuer" in value
+        and "value" in value
+    )
+
+
+@lru_cache(maxsize=2048)
+def _serialize_cached(
+    field_type: Type[Union[AccountID, Currency]], value: str
+) -> bytes:
+    """
+    Serializes a currency code or issuer, caching the result since the same
+    currencies and issuers appear in many amounts.
+
+    Args:
+        field_type: Currency or AccountID.
+        value: The currency code or issuer address to serialize.
+
+    Returns:
+        The bytes representing the serialized currency code or issuer.
+    """
+    return bytes(field_type.from_value(value))
+
+
+def _serialize_currency_or_issuer(
+    field_type: Type[Union[AccountID, Currency]], value: str
+) -> bytes:
+    """
+    Serializes the currency code or issuer of an issued currency amount.
+
+    Args:
+        field_type: Currency or AccountID.
+        value: The currency code or issuer address to serialize.
+
+    Returns:
+        The bytes representing the serialized currency code or issuer.
+    """
+    # The cache hashes its arguments, so values that aren't a str (and might not
+    # be hashable) go straight to from_value, which rejects them.
+    if not isinstance(value, str):
+        return bytes(field_type.from_value(value))
+    return _serialize_cached(field_type, value)
 
 
 def _serialize_issued_currency_amount(value: Dict[str, str]) -> bytes:
@@ -207,8 +299,8 @@ def _serialize_issued_currency_amount(value: Dict[str, str]) -> bytes:
     """
     amount_string = value["value"]
     amount_bytes = _serialize_issued_currency_value(amount_string)
-    currency_bytes = bytes(Currency.from_value(value["currency"]))
-    issuer_bytes = bytes(AccountID.from_value(value["issuer"]))
+    currency_bytes = _serialize_currency_or_issuer(Currency, value["currency"])
+    issuer_bytes = _serialize_currency_or_issuer(AccountID, value["issuer"])
     return amount_bytes + currency_bytes + issuer_bytes
 
 
@@ -220,6 +312,10 @@ class Amount(SerializedType):
     def __init__(self: Amount, buffer: bytes) -> None:
         """Construct an Amount from given bytes."""
         super().__init__(buffer)
+        # The buffer never changes, so read the flags in the 1st byte only once:
+        # the 1st bit is set to 0 for native XRP, the 2nd to 1 for positive amounts
+        self._is_native = (buffer[0] & 0x80) == 0
+        self._is_positive = (buffer[0] & 0x40) > 0
 
     @classmethod
     def from_value(cls: Type[Amount], value: Union[str, Dict[str, str]]) -> Amount:
@@ -240,7 +336,7 @@ class Amount(SerializedType):
         """
         if isinstance(value, str):
             return cls(_serialize_xrp_amount(value))
-        if IssuedCurrencyAmount.is_dict_of_model(value):
+        if isinstance(value, dict) and _is_valid_issued_currency_amount(value):
             return cls(_serialize_issued_currency_amount(value))
 
         raise XRPLBinaryCodecException(
@@ -279,28 +375,34 @@ class Amount(SerializedType):
         """
         if self.is_native():
             sign = "" if self.is_positive() else "-"
-            masked_bytes = (
-                int.from_bytes(self.buffer, byteorder="big") & 0x3FFFFFFFFFFFFFFF
-            )
+            masked_bytes = _U64.unpack_from(self.buffer)[0] & 0x3FFFFFFFFFFFFFFF
             return f"{sign}{masked_bytes}"
-        parser = BinaryParser(str(self))
-        value_bytes = parser.read(8)
-        currency = Currency.from_parser(parser)
-        issuer = AccountID.from_parser(parser)
-        b1 = value_bytes[0]
-        b2 = value_bytes[1]
-        is_positive = b1 & 0x40
-        sign = "" if is_positive else "-"
-        exponent = ((b1 & 0x3F) << 2) + ((b2 & 0xFF) >> 6) - 97
-        hex_mantissa = hex(b2 & 0x3F) + value_bytes[2:].hex()
-        int_mantissa = int(hex_mantissa[2:], 16)
-        value = Decimal(f"{sign}{int_mantissa}") * Decimal(f"1e{exponent}")
-
-        if value.is_zero():
+        # 8 bytes of value, then 20 bytes each of currency code and issuer
+        currency = Currency(self.buffer[8:28])
+        issuer = AccountID(self.buffer[28:48])
+        serial = _U64.unpack_from(self.buffer)[0]
+        exponent = ((serial >> 54) & 0xFF) - 97  # 8 bits after "not XRP" and sign
+        int_mantissa = serial & _MANTISSA_BIT_MASK  # last 54 bits
+
+        if int_mantissa == 0:
             value_str = "0"
         else:
-            value_str = str(value).rstrip("0").rstrip(".")
-        verify_iou_value(value_str)
+            sign = "" if self.is_positive() else "-"
+            # Constructing a Decimal is exact (unlike arithmetic in the Decimal
+            # context configured above), so large exponents don't overflow.
+            _verify_iou_decimal(Decimal(f"{sign}{int_mantissa}e{exponent}"))
+            # Drop the mantissa's trailing zeros, without turning integers into
+            # scientific notation: "2.1" rather than "2.100000000000000", "1E+20"
+            # rather than "1.000000000000000E+20", but still "100". The exponent
+            # can't go past the maximum, or from_value would reject the string.
+            while (
+                int_mantissa % 10 == 0
+                and exponent != 0
+                and exponent < _MAX_IOU_EXPONENT
+            ):
+                int_mantissa //= 10
+                exponent += 1
+            value_str = str(Decimal(f"{sign}{int_mantissa}e{exponent}"))
 
         return {
             "value": value_str,
@@ -314,8 +416,7 @@ class Amount(SerializedType):
         Returns:
             True if this amount is a native XRP amount, False otherwise.
         """
-        # 1st bit in 1st byte is set to 0 for native XRP
-        return (self.buffer[0] & 0x80) == 0
+        return self._is_native
 
     def is_positive(self: Amount) -> bool:
         """Returns True if 2nd bit in 1st byte is set to 1 (positive amount).
@@ -324,4 +425,4 @@ class Amount(SerializedType):
             True if 2nd bit in 1st byte is set to 1 (positive amount),
             False otherwise.
         """
-        return (bytes(self)[0] & 0x40) > 0
+        return self._is_positive
@@ -116,7 +116,7 @@ class Currency(Hash160):
             return Currency(_iso_to_bytes(value))
         if _is_hex(value):
             return cls(bytes.fromhex(value))
-        raise XRPLBinaryCodecException("Unsupported Currency representation: {value}")
+        raise XRPLBinaryCodecException(f"Unsupported Currency representation: {value}")
 
     def to_json(self: Currency) -> str:
         """
@@ -28,7 +28,7 @@ class Hash(SerializedType, ABC):
         buffer = buffer if buffer is not None else bytes(self._get_length())
 
         if len(buffer) != self._get_length():
-            raise XRPLBinaryCodecException("Invalid hash length {len(buffer)}")
+            raise XRPLBinaryCodecException(f"Invalid hash length {len(buffer)}")
         super().__init__(buffer)
 
     def __str__(self: Hash) -> str:
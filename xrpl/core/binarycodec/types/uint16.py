@@ -55,7 +55,7 @@ class UInt16(UInt):
         if not isinstance(value, int):
             raise XRPLBinaryCodecException(
                 "Invalid type to construct a UInt16: expected int, "
-                "received {value.__class__.__name__}."
+                f"received {value.__class__.__name__}."
             )
 
         if isinstance(value, int):
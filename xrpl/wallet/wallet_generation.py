@@ -59,7 +59,7 @@ def generate_faucet_wallet(
     # The faucet *can* be flakey... by printing info about this it's easier to
     # understand if tests are actually failing, or if it was just a faucet failure.
     if debug:
-        print("Attempting to fund address {}".format(address))
+        print(f"Attempting to fund address {address}")
     # Balance prior to asking for more funds
     starting_balance = _check_wallet_balance(address, client)
 
@@ -87,9 +87,7 @@ def generate_faucet_wallet(
                 return wallet
 
     raise XRPLFaucetException(
-        "Unable to fund address with faucet after waiting {} seconds".format(
-            _TIMEOUT_SECONDS
-        )
+        f"Unable to fund address with faucet after waiting {_TIMEOUT_SECONDS} seconds"
     )
 
 